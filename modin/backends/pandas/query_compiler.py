@@ -566,7 +566,9 @@ class PandasQueryCompiler(BaseQueryCompiler):
             if is_list_like(result):
                 return pandas.DataFrame(result)
             else:
-                return pandas.DataFrame([result])
+                # Build the 1x1 frame from a column mapping, which skips the row-wise
+                # inference done for list input.
+                return pandas.DataFrame({"__reduced__": [result]})
 
         if len(self.columns) == 1:
             axis = 0
@@ -11,194 +11,372 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import inspect
 import os
 import sys
+import threading
 import warnings
 
 from modin import __execution_engine__ as execution_engine
 from modin import __partition_format__ as partition_format
 
 
+def _has_default_read_csv_args(kwargs, ignore=("engine",)):
+    """Check that all `read_csv` arguments, other than `ignore`, have their defaults.
+
+    Args:
+        kwargs: The `read_csv` keyword arguments.
+        ignore: The names of the arguments to skip.
+
+    Returns:
+        True if every argument has the same value as in `pandas.read_csv`.
+    """
+    import pandas
+
+    defaults = inspect.signature(pandas.read_csv).parameters
+    for key, value in kwargs.items():
+        if key in ignore:
+            continue
+        default = defaults[key].default if key in defaults else None
+        if value is not default and (
+            type(value) is not type(default) or value != default
+        ):
+            return False
+    return True
+
+
+def _dispatch(name):
+    """Build a classmethod that forwards the call to `_<name>` of the engine factory.
+
+    Args:
+        name: The name of the public method.
+
+    Returns:
+        A classmethod.
+    """
+    private_name = "_" + name
+
+    def dispatcher(cls, *args, **kwargs):
+        return getattr(cls._determine_engine(), private_name)(*args, **kwargs)
+
+    dispatcher.__name__ = name
+    return classmethod(dispatcher)
+
+
+def _dispatch_read(name):
+    """Build a keyword-only classmethod that forwards a `read_*` call to the engine.
+
+    Note: The readers only accept keyword arguments, so positional arguments are
+        rejected here rather than passed on to `_<name>`.
+
+    Args:
+        name: The name of the public method.
+
+    Returns:
+        A classmethod.
+    """
+    private_name = "_" + name
+
+    def dispatcher(cls, **kwargs):
+        return getattr(cls._determine_engine(), private_name)(**kwargs)
+
+    dispatcher.__name__ = name
+    return classmethod(dispatcher)
+
+
 class BaseFactory(object):
     @property
     def io_cls(self):
         """The module where the I/O functionality exists."""
         raise NotImplementedError("Implement in children classes!")
 
+    # The resolved factories, keyed by whether the experimental API is enabled. The
+    # engine and partition format are fixed at import, but `MODIN_EXPERIMENTAL` may
+    # be set later (e.g. by importing `modin.experimental.pandas`).
+    _engines = {}
+
     @classmethod
     def _determine_engine(cls):
-        if os.environ.get("MODIN_EXPERIMENTAL", "") == "True":
-            return ExperimentalBaseFactory._determine_engine()
-        factory_name = partition_format + "On" + execution_engine + "Factory"
-        return getattr(sys.modules[__name__], factory_name)
+        experimental = os.environ.get("MODIN_EXPERIMENTAL", "") == "True"
+        engine = BaseFactory._engines.get(experimental)
+        if engine is None:
+            if experimental:
+                engine = ExperimentalBaseFactory._determine_engine()
+            else:
+                factory_name = partition_format + "On" + execution_engine + "Factory"
+                engine = getattr(sys.modules[__name__], factory_name)
+            BaseFactory._engines[experimental] = engine
+        return engine
 
     @classmethod
     def build_manager(cls):
         return cls._determine_engine().build_manager()
 
-    @classmethod
-    def from_pandas(cls, df):
-        return cls._determine_engine()._from_pandas(df)
+    from_pandas = _dispatch("from_pandas")
 
     @classmethod
     def _from_pandas(cls, df):
         return cls.io_cls.from_pandas(df)
 
-    @classmethod
-    def from_non_pandas(cls, *args, **kwargs):
-        return cls._determine_engine()._from_non_pandas(*args, **kwargs)
+    from_non_pandas = _dispatch("from_non_pandas")
 
     @classmethod
     def _from_non_pandas(cls, *args, **kwargs):
         return cls.io_cls.from_non_pandas(*args, **kwargs)
 
-    @classmethod
-    def read_parquet(cls, **kwargs):
-        return cls._determine_engine()._read_parquet(**kwargs)
+    read_parquet = _dispatch_read("read_parquet")
 
     @classmethod
     def _read_parquet(cls, **kwargs):
         return cls.io_cls.read_parquet(**kwargs)
 
-    @classmethod
-    def read_csv(cls, **kwargs):
-        return cls._determine_engine()._read_csv(**kwargs)
+    read_csv = _dispatch_read("read_csv")
 
     @classmethod
     def _read_csv(cls, **kwargs):
+        if os.environ.get("MODIN_CSV_PARQUET_CACHE", "") == "True":
+            result = cls._read_csv_with_parquet_cache(**kwargs)
+            if result is not None:
+                return result
+        if kwargs.get("engine", None) == "pyarrow":
+            result = cls._read_csv_with_pyarrow(**kwargs)
+            if result is not None:
+                return result
+            # Fall back to the default parser for arguments `pyarrow` can't handle.
+            kwargs["engine"] = None
         return cls.io_cls.read_csv(**kwargs)
 
     @classmethod
-    def read_json(cls, **kwargs):
-        return cls._determine_engine()._read_json(**kwargs)
+    def _read_csv_with_pyarrow(
+        cls, filepath_or_buffer, sep=",", delimiter=None, **kwargs
+    ):
+        """Read a local CSV file with the multithreaded `pyarrow` CSV reader.
+
+        Note: `pyarrow` infers the column types on its own (e.g. it parses ISO-8601
+            strings as timestamps), which is why this is only used when the user
+            explicitly asks for `engine="pyarrow"`. Empty fields and pandas' default
+            NA markers are read as nulls, which `pyarrow` gives as None in string
+            columns, so those are turned into NaN to match pandas.
+
+        Args:
+            filepath_or_buffer: The path of the CSV file.
+            sep: The delimiter to use.
+            delimiter: Alias for sep.
+            kwargs: The rest of the `read_csv` arguments. All of them must have their
+                default value for `pyarrow` to be used.
+
+        Returns:
+            A new Query Compiler, or None if the arguments are not supported.
+        """
+        import numpy as np
+        import pandas
+
+        if delimiter is None:
+            delimiter = sep
+        if (
+            not isinstance(filepath_or_buffer, str)
+            or not isinstance(delimiter, str)
+            or len(delimiter) != 1
+            or not os.path.isfile(filepath_or_buffer)
+        ):
+            return None
+        if not _has_default_read_csv_args(kwargs):
+            return None
+        try:
+            import pyarrow
+            from pyarrow import csv
+        except ImportError:
+            return None
+        from pandas._libs.parsers import STR_NA_VALUES
+
+        try:
+            table = csv.read_csv(
+                filepath_or_buffer,
+                read_options=csv.ReadOptions(use_threads=True),
+                parse_options=csv.ParseOptions(delimiter=delimiter),
+                convert_options=csv.ConvertOptions(
+                    null_values=sorted(STR_NA_VALUES), strings_can_be_null=True
+                ),
+            )
+        except pyarrow.ArrowException:
+            return None
+        # Use the column names pandas would give (e.g. "Unnamed: 0", mangled
+        # duplicates), since `pyarrow` keeps the raw header.
+        columns = pandas.read_csv(filepath_or_buffer, sep=delimiter, nrows=0).columns
+        if len(columns) != table.num_columns:
+            return None
+        df = table.rename_columns(list(columns)).to_pandas()
+        object_columns = df.columns[df.dtypes == object]
+        if len(object_columns):
+            df[object_columns] = df[object_columns].where(
+                df[object_columns].notna(), np.nan
+            )
+        return cls._from_pandas(df)
+
+    @classmethod
+    def _read_csv_with_parquet_cache(cls, filepath_or_buffer, **kwargs):
+        """Read a CSV file from its Parquet copy, creating the copy if needed.
+
+        Note: This is enabled with `MODIN_CSV_PARQUET_CACHE=True`. The copy is stored
+            next to the CSV file as `<path>.parquet` and gets the modification time
+            the CSV file had before it was read, so it is only used while the CSV
+            file keeps that exact time. It is written in a background thread after
+            the CSV file is read, so the first read is not slowed down (though the
+            interpreter waits for it at exit).
+
+        Args:
+            filepath_or_buffer: The path of the CSV file.
+            kwargs: The rest of the `read_csv` arguments. All of them must have their
+                default value for the cache to be used.
+
+        Returns:
+            A new Query Compiler, or None if the cache can't be used.
+        """
+        if (
+            not isinstance(filepath_or_buffer, str)
+            or not os.path.isfile(filepath_or_buffer)
+            or not _has_default_read_csv_args(kwargs, ignore=())
+        ):
+            return None
+        cache_path = filepath_or_buffer + ".parquet"
+        # Taken before the read, so a CSV file rewritten while it is being read (or
+        # before the copy is written) never matches the copy.
+        csv_mtime_ns = os.stat(filepath_or_buffer).st_mtime_ns
+        if (
+            os.path.isfile(cache_path)
+            and os.stat(cache_path).st_mtime_ns == csv_mtime_ns
+        ):
+            import numpy as np
+
+            query_compiler = cls._read_parquet(
+                path=cache_path, columns=None, engine="auto"
+            )
+            # Parquet gives None for missing strings, where the CSV parser gives NaN.
+            object_columns = query_compiler.columns[query_compiler.dtypes == object]
+            if len(object_columns):
+                query_compiler = query_compiler.fillna(
+                    value={col: np.nan for col in object_columns}
+                )
+            return query_compiler
+        result = cls.io_cls.read_csv(filepath_or_buffer=filepath_or_buffer, **kwargs)
+
+        def write_cache():
+            tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            try:
+                result.to_pandas().to_parquet(tmp_path, compression="snappy")
+                os.utime(tmp_path, ns=(csv_mtime_ns, csv_mtime_ns))
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                # The cache is only an optimization, so a failure to write it must
+                # not affect the user.
+                pass
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        # Not a daemon thread: a daemon would be killed mid-write at interpreter exit
+        # (skipping the cleanup above) and leave a partial temporary file next to the
+        # user's data, so the interpreter waits for the copy to be finished instead.
+        threading.Thread(target=write_cache).start()
+        return result
+
+    read_json = _dispatch_read("read_json")
 
     @classmethod
     def _read_json(cls, **kwargs):
         return cls.io_cls.read_json(**kwargs)
 
-    @classmethod
-    def read_gbq(cls, **kwargs):
-        return cls._determine_engine()._read_gbq(**kwargs)
+    read_gbq = _dispatch_read("read_gbq")
 
     @classmethod
     def _read_gbq(cls, **kwargs):
         return cls.io_cls.read_gbq(**kwargs)
 
-    @classmethod
-    def read_html(cls, **kwargs):
-        return cls._determine_engine()._read_html(**kwargs)
+    read_html = _dispatch_read("read_html")
 
     @classmethod
     def _read_html(cls, **kwargs):
         return cls.io_cls.read_html(**kwargs)
 
-    @classmethod
-    def read_clipboard(cls, **kwargs):  # pragma: no cover
-        return cls._determine_engine()._read_clipboard(**kwargs)
+    read_clipboard = _dispatch_read("read_clipboard")  # pragma: no cover
 
     @classmethod
     def _read_clipboard(cls, **kwargs):  # pragma: no cover
         return cls.io_cls.read_clipboard(**kwargs)
 
-    @classmethod
-    def read_excel(cls, **kwargs):
-        return cls._determine_engine()._read_excel(**kwargs)
+    read_excel = _dispatch_read("read_excel")
 
     @classmethod
     def _read_excel(cls, **kwargs):
         return cls.io_cls.read_excel(**kwargs)
 
-    @classmethod
-    def read_hdf(cls, **kwargs):
-        return cls._determine_engine()._read_hdf(**kwargs)
+    read_hdf = _dispatch_read("read_hdf")
 
     @classmethod
     def _read_hdf(cls, **kwargs):
         return cls.io_cls.read_hdf(**kwargs)
 
-    @classmethod
-    def read_feather(cls, **kwargs):
-        return cls._determine_engine()._read_feather(**kwargs)
+    read_feather = _dispatch_read("read_feather")
 
     @classmethod
     def _read_feather(cls, **kwargs):
         return cls.io_cls.read_feather(**kwargs)
 
-    @classmethod
-    def read_stata(cls, **kwargs):
-        return cls._determine_engine()._read_stata(**kwargs)
+    read_stata = _dispatch_read("read_stata")
 
     @classmethod
     def _read_stata(cls, **kwargs):
         return cls.io_cls.read_stata(**kwargs)
 
-    @classmethod
-    def read_sas(cls, **kwargs):  # pragma: no cover
-        return cls._determine_engine()._read_sas(**kwargs)
+    read_sas = _dispatch_read("read_sas")  # pragma: no cover
 
     @classmethod
     def _read_sas(cls, **kwargs):  # pragma: no cover
         return cls.io_cls.read_sas(**kwargs)
 
-    @classmethod
-    def read_pickle(cls, **kwargs):
-        return cls._determine_engine()._read_pickle(**kwargs)
+    read_pickle = _dispatch_read("read_pickle")
 
     @classmethod
     def _read_pickle(cls, **kwargs):
         return cls.io_cls.read_pickle(**kwargs)
 
-    @classmethod
-    def read_sql(cls, **kwargs):
-        return cls._determine_engine()._read_sql(**kwargs)
+    read_sql = _dispatch_read("read_sql")
 
     @classmethod
     def _read_sql(cls, **kwargs):
         return cls.io_cls.read_sql(**kwargs)
 
-    @classmethod
-    def read_fwf(cls, **kwargs):
-        return cls._determine_engine()._read_fwf(**kwargs)
+    read_fwf = _dispatch_read("read_fwf")
 
     @classmethod
     def _read_fwf(cls, **kwargs):
         return cls.io_cls.read_fwf(**kwargs)
 
-    @classmethod
-    def read_sql_table(cls, **kwargs):
-        return cls._determine_engine()._read_sql_table(**kwargs)
+    read_sql_table = _dispatch_read("read_sql_table")
 
     @classmethod
     def _read_sql_table(cls, **kwargs):
         return cls.io_cls.read_sql_table(**kwargs)
 
-    @classmethod
-    def read_sql_query(cls, **kwargs):
-        return cls._determine_engine()._read_sql_query(**kwargs)
+    read_sql_query = _dispatch_read("read_sql_query")
 
     @classmethod
     def _read_sql_query(cls, **kwargs):
         return cls.io_cls.read_sql_query(**kwargs)
 
-    @classmethod
-    def read_spss(cls, **kwargs):
-        return cls._determine_engine()._read_spss(**kwargs)
+    read_spss = _dispatch_read("read_spss")
 
     @classmethod
     def _read_spss(cls, **kwargs):
         return cls.io_cls.read_spss(**kwargs)
 
-    @classmethod
-    def to_sql(cls, *args, **kwargs):
-        return cls._determine_engine()._to_sql(*args, **kwargs)
+    to_sql = _dispatch("to_sql")
 
     @classmethod
     def _to_sql(cls, *args, **kwargs):
         return cls.io_cls.to_sql(*args, **kwargs)
 
-    @classmethod
-    def to_pickle(cls, *args, **kwargs):
-        return cls._determine_engine()._to_pickle(*args, **kwargs)
+    to_pickle = _dispatch("to_pickle")
 
     @classmethod
     def _to_pickle(cls, *args, **kwargs):
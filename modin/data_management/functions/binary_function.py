@@ -21,10 +21,10 @@ class BinaryFunction(Function):
     @classmethod
     def call(cls, func, *call_args, **call_kwds):
         def caller(query_compiler, other, *args, **kwargs):
-            axis = kwargs.get("axis", 0)
             broadcast = kwargs.pop("broadcast", False)
             if isinstance(other, type(query_compiler)):
                 if broadcast:
+                    axis = kwargs.get("axis", 0)
                     assert (
                         len(other.columns) == 1
                     ), "Invalid broadcast argument for `broadcast_apply`, too many columns: {}".format(
@@ -44,15 +44,14 @@ class BinaryFunction(Function):
                 else:
                     return query_compiler.__constructor__(
                         query_compiler._modin_frame._binary_op(
-                            lambda x, y: func(x, y, *args, **kwargs),
-                            other._modin_frame,
+                            cls._bind_args(func, args, kwargs), other._modin_frame
                         )
                     )
             else:
                 if isinstance(other, (list, np.ndarray, pandas.Series)):
                     new_columns = query_compiler.columns
                     new_modin_frame = query_compiler._modin_frame._apply_full_axis(
-                        axis,
+                        kwargs.get("axis", 0),
                         lambda df: func(df, other, *args, **kwargs),
                         new_index=query_compiler.index,
                         new_columns=new_columns,
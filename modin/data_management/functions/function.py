@@ -11,6 +11,8 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+from functools import partial
+
 
 class Function(object):
     def __init__(self):
@@ -27,3 +29,24 @@ class Function(object):
     @classmethod
     def register(cls, func, **kwargs):
         return cls.call(func, **kwargs)
+
+    @staticmethod
+    def _bind_args(func, args, kwargs):
+        """Bind the call arguments so that `func` can be applied to partitions.
+
+        Note: A `functools.partial` is cheaper to build and to serialize than a
+            lambda, but it can only append arguments after the partitions, so it is
+            used when there are no extra positional arguments.
+
+        Args:
+            func: The function to bind.
+            args: The positional arguments passed after the partitions.
+            kwargs: The keyword arguments.
+
+        Returns:
+            A callable taking the partitions (e.g. the left and right operands of a
+            binary operation) as its only arguments.
+        """
+        if args:
+            return lambda *partitions: func(*(partitions + args), **kwargs)
+        return partial(func, **kwargs)
@@ -17,14 +17,15 @@ from .function import Function
 class MapReduceFunction(Function):
     @classmethod
     def call(cls, map_function, reduce_function, **call_kwds):
+        has_axis = "axis" in call_kwds
+        axis = call_kwds.get("axis")
+
         def caller(query_compiler, *args, **kwargs):
             return query_compiler.__constructor__(
                 query_compiler._modin_frame._map_reduce(
-                    call_kwds.get("axis")
-                    if "axis" in call_kwds
-                    else kwargs.get("axis"),
-                    lambda x: map_function(x, *args, **kwargs),
-                    lambda y: reduce_function(y, *args, **kwargs),
+                    axis if has_axis else kwargs.get("axis"),
+                    cls._bind_args(map_function, args, kwargs),
+                    cls._bind_args(reduce_function, args, kwargs),
                 )
             )
 
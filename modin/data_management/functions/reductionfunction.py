@@ -17,13 +17,14 @@ from .function import Function
 class ReductionFunction(Function):
     @classmethod
     def call(cls, reduction_function, **call_kwds):
+        has_axis = "axis" in call_kwds
+        axis = call_kwds.get("axis")
+
         def caller(query_compiler, *args, **kwargs):
             return query_compiler.__constructor__(
                 query_compiler._modin_frame._fold_reduce(
-                    call_kwds.get("axis")
-                    if "axis" in call_kwds
-                    else kwargs.get("axis"),
-                    lambda x: reduction_function(x, *args, **kwargs),
+                    axis if has_axis else kwargs.get("axis"),
+                    cls._bind_args(reduction_function, args, kwargs),
                 )
             )
 
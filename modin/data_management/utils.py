@@ -105,3 +105,36 @@ def length_fn_pandas(df):
 def width_fn_pandas(df):
     assert isinstance(df, pandas.DataFrame)
     return len(df.columns) if len(df) > 0 else 0
+
+
+def is_full_axis_mask(indices, length):
+    """Check whether positional indices select a whole partition axis, in order.
+
+    Note: Indexers with the same length as the axis are not enough, since they may be
+        permuted or contain duplicates (e.g. `df.iloc[::-1]`).
+
+    Args:
+        indices: The positional indexer (a slice or a list-like of integers).
+        length: The length of the axis, or None if it is not known.
+
+    Returns:
+        True if masking the axis with `indices` would return it unchanged.
+    """
+    if isinstance(indices, slice):
+        return indices == slice(None) or (
+            length is not None and indices.indices(length) == (0, length, 1)
+        )
+    return (
+        length is not None
+        and len(indices) == length
+        and np.array_equal(indices, np.arange(length))
+    )
+
+
+def mask_fn_pandas(df, row_indices, col_indices):
+    """Extract the given positional rows and columns from a partition.
+
+    Note: This is a module-level function rather than a lambda so that it is
+        pickled by reference when queued on remote partitions.
+    """
+    return df.iloc[row_indices, col_indices]
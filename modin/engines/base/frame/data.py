@@ -85,9 +85,10 @@ class BasePandasFrame(object):
         """
         if self._row_lengths_cache is None:
             if len(self._partitions.T) > 0:
-                self._row_lengths_cache = [
-                    obj.length() for obj in self._partitions.T[0]
-                ]
+                partition_class = self._frame_mgr_cls._partition_class
+                self._row_lengths_cache = partition_class.length_of_many(
+                    self._partitions.T[0]
+                )
             else:
                 self._row_lengths_cache = []
         return self._row_lengths_cache
@@ -101,7 +102,10 @@ class BasePandasFrame(object):
         """
         if self._column_widths_cache is None:
             if len(self._partitions) > 0:
-                self._column_widths_cache = [obj.width() for obj in self._partitions[0]]
+                partition_class = self._frame_mgr_cls._partition_class
+                self._column_widths_cache = partition_class.width_of_many(
+                    self._partitions[0]
+                )
             else:
                 self._column_widths_cache = []
         return self._column_widths_cache
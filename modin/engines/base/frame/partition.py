@@ -26,6 +26,11 @@ class BaseFramePartition(object):  # pragma: no cover
         subclasses. There is no logic for updating inplace.
     """
 
+    # Frames can hold a large number of partitions, so the instance attributes are
+    # declared as slots instead of living in a per-instance `__dict__`. Subclasses
+    # must declare their own `__slots__` for any attribute they add.
+    __slots__ = ("call_queue", "_length_cache", "_width_cache")
+
     # Abstract methods and fields. These must be implemented in order to
     # properly subclass this object. There are also some abstract classmethods
     # to implement.
@@ -149,9 +154,6 @@ class BaseFramePartition(object):  # pragma: no cover
         """
         raise NotImplementedError(NOT_IMPLEMENTED_MESSAGE)
 
-    _length_cache = None
-    _width_cache = None
-
     def length(self):
         if self._length_cache is None:
             cls = type(self)
@@ -168,6 +170,36 @@ class BaseFramePartition(object):  # pragma: no cover
             self._width_cache = self.apply(preprocessed_func)
         return self._width_cache
 
+    @classmethod
+    def length_of_many(cls, partitions):
+        """Compute the lengths of several partitions.
+
+        Note: Engines that can compute the lengths concurrently should override this
+            instead of waiting on each partition in turn.
+
+        Args:
+            partitions: The partitions to compute the lengths of.
+
+        Returns:
+            A list of lengths.
+        """
+        return [obj.length() for obj in partitions]
+
+    @classmethod
+    def width_of_many(cls, partitions):
+        """Compute the widths of several partitions.
+
+        Note: Engines that can compute the widths concurrently should override this
+            instead of waiting on each partition in turn.
+
+        Args:
+            partitions: The partitions to compute the widths of.
+
+        Returns:
+            A list of widths.
+        """
+        return [obj.width() for obj in partitions]
+
     @classmethod
     def empty(cls):
         """Create an empty partition
@@ -14,7 +14,12 @@
 import pandas
 
 from modin.engines.base.frame.partition import BaseFramePartition
-from modin.data_management.utils import length_fn_pandas, width_fn_pandas
+from modin.data_management.utils import (
+    is_full_axis_mask,
+    length_fn_pandas,
+    mask_fn_pandas,
+    width_fn_pandas,
+)
 from modin import __execution_engine__
 
 if __execution_engine__ == "Dask":
@@ -42,6 +47,8 @@ class PandasOnDaskFramePartition(BaseFramePartition):
         subclasses. There is no logic for updating inplace.
     """
 
+    __slots__ = ("future",)
+
     def __init__(self, future, length=None, width=None, call_queue=None):
         self.future = future
         if call_queue is None:
@@ -97,8 +104,13 @@ class PandasOnDaskFramePartition(BaseFramePartition):
         self.call_queue = []
 
     def mask(self, row_indices, col_indices):
+        if is_full_axis_mask(row_indices, self._length_cache) and is_full_axis_mask(
+            col_indices, self._width_cache
+        ):
+            return self.__copy__()
+
         new_obj = self.add_to_apply_calls(
-            lambda df: pandas.DataFrame(df.iloc[row_indices, col_indices])
+            mask_fn_pandas, row_indices=row_indices, col_indices=col_indices
         )
         new_obj._length_cache = (
             len(row_indices)
@@ -114,7 +126,7 @@ class PandasOnDaskFramePartition(BaseFramePartition):
 
     def __copy__(self):
         return PandasOnDaskFramePartition(
-            self.future, self._length_cache, self._width_cache
+            self.future, self._length_cache, self._width_cache, self.call_queue
         )
 
     def to_pandas(self):
@@ -150,7 +162,7 @@ class PandasOnDaskFramePartition(BaseFramePartition):
             A `RemotePartitions` object.
         """
         client = get_client()
-        return cls(client.scatter(obj, hash=False))
+        return cls(client.scatter(obj, hash=False), len(obj.index), len(obj.columns))
 
     @classmethod
     def preprocess_func(cls, func):
@@ -187,9 +199,6 @@ class PandasOnDaskFramePartition(BaseFramePartition):
         """
         return width_fn_pandas
 
-    _length_cache = None
-    _width_cache = None
-
     def length(self):
         if self._length_cache is None:
             self._length_cache = self.apply(lambda df: len(df)).future
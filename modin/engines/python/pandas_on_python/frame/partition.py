@@ -13,7 +13,12 @@
 
 import pandas
 
-from modin.data_management.utils import length_fn_pandas, width_fn_pandas
+from modin.data_management.utils import (
+    is_full_axis_mask,
+    length_fn_pandas,
+    mask_fn_pandas,
+    width_fn_pandas,
+)
 from modin.engines.base.frame.partition import BaseFramePartition
 
 
@@ -29,6 +34,8 @@ class PandasOnPythonFramePartition(BaseFramePartition):
         subclasses. There is no logic for updating inplace.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, data, length=None, width=None, call_queue=None):
         self.data = data
         if call_queue is None:
@@ -88,8 +95,13 @@ class PandasOnPythonFramePartition(BaseFramePartition):
         self.apply(lambda x: x)
 
     def mask(self, row_indices=None, col_indices=None):
+        if is_full_axis_mask(row_indices, self._length_cache) and is_full_axis_mask(
+            col_indices, self._width_cache
+        ):
+            return self.__copy__()
+
         new_obj = self.add_to_apply_calls(
-            lambda df: pandas.DataFrame(df.iloc[row_indices, col_indices])
+            mask_fn_pandas, row_indices=row_indices, col_indices=col_indices
         )
         new_obj._length_cache = (
             len(row_indices)
@@ -103,6 +115,11 @@ class PandasOnPythonFramePartition(BaseFramePartition):
         )
         return new_obj
 
+    def __copy__(self):
+        return PandasOnPythonFramePartition(
+            self.data.copy(), self._length_cache, self._width_cache, self.call_queue
+        )
+
     def to_pandas(self):
         """Convert the object stored in this partition to a Pandas DataFrame.
 
@@ -135,7 +152,7 @@ class PandasOnPythonFramePartition(BaseFramePartition):
         Returns:
             A `RemotePartitions` object.
         """
-        return cls(obj)
+        return cls(obj, len(obj.index), len(obj.columns))
 
     @classmethod
     def preprocess_func(cls, func):
@@ -172,9 +189,6 @@ class PandasOnPythonFramePartition(BaseFramePartition):
         """
         return width_fn_pandas
 
-    _length_cache = None
-    _width_cache = None
-
     def length(self):
         if self._length_cache is None:
             self._length_cache = self.apply(self.length_extraction_fn()).data
@@ -187,4 +201,4 @@ class PandasOnPythonFramePartition(BaseFramePartition):
 
     @classmethod
     def empty(cls):
-        return cls(pandas.DataFrame())
+        return cls(pandas.DataFrame(), 0, 0)
@@ -14,7 +14,12 @@
 import pandas
 
 from modin.engines.base.frame.partition import BaseFramePartition
-from modin.data_management.utils import length_fn_pandas, width_fn_pandas
+from modin.data_management.utils import (
+    is_full_axis_mask,
+    length_fn_pandas,
+    mask_fn_pandas,
+    width_fn_pandas,
+)
 from modin.engines.ray.utils import handle_ray_task_error
 from modin import __execution_engine__
 
@@ -24,6 +29,8 @@ if __execution_engine__ == "Ray":
 
 
 class PandasOnRayFramePartition(BaseFramePartition):
+    __slots__ = ("oid",)
+
     def __init__(self, object_id, length=None, width=None, call_queue=None):
         assert type(object_id) is ray.ObjectID
 
@@ -104,20 +111,13 @@ class PandasOnRayFramePartition(BaseFramePartition):
         return self.apply(lambda df: df.values).get()
 
     def mask(self, row_indices, col_indices):
-        if (
-            isinstance(row_indices, slice)
-            or (
-                self._length_cache is not None
-                and len(row_indices) == self._length_cache
-            )
-        ) and (
-            isinstance(col_indices, slice)
-            or (self._width_cache is not None and len(col_indices) == self._width_cache)
+        if is_full_axis_mask(row_indices, self._length_cache) and is_full_axis_mask(
+            col_indices, self._width_cache
         ):
             return self.__copy__()
 
         new_obj = self.add_to_apply_calls(
-            lambda df: pandas.DataFrame(df.iloc[row_indices, col_indices])
+            mask_fn_pandas, row_indices=row_indices, col_indices=col_indices
         )
         new_obj._length_cache = (
             len(row_indices)
@@ -155,14 +155,18 @@ class PandasOnRayFramePartition(BaseFramePartition):
         """
         return ray.put(func)
 
+    def _submit_shape(self):
+        """Launch the computation of the length and width without waiting for it."""
+        if len(self.call_queue):
+            self.drain_call_queue()
+        else:
+            self._length_cache, self._width_cache = get_index_and_columns.remote(
+                self.oid
+            )
+
     def length(self):
         if self._length_cache is None:
-            if len(self.call_queue):
-                self.drain_call_queue()
-            else:
-                self._length_cache, self._width_cache = get_index_and_columns.remote(
-                    self.oid
-                )
+            self._submit_shape()
         if isinstance(self._length_cache, ray.ObjectID):
             try:
                 self._length_cache = ray.get(self._length_cache)
@@ -172,12 +176,7 @@ class PandasOnRayFramePartition(BaseFramePartition):
 
     def width(self):
         if self._width_cache is None:
-            if len(self.call_queue):
-                self.drain_call_queue()
-            else:
-                self._length_cache, self._width_cache = get_index_and_columns.remote(
-                    self.oid
-                )
+            self._submit_shape()
         if isinstance(self._width_cache, ray.ObjectID):
             try:
                 self._width_cache = ray.get(self._width_cache)
@@ -185,6 +184,42 @@ class PandasOnRayFramePartition(BaseFramePartition):
                 handle_ray_task_error(e)
         return self._width_cache
 
+    @classmethod
+    def _get_shape_of_many(cls, partitions, cache_name):
+        """Fill the `cache_name` cache of every partition, waiting on them together.
+
+        Args:
+            partitions: The partitions to compute the length or width of.
+            cache_name: Either "_length_cache" or "_width_cache".
+
+        Returns:
+            A list with the value of the cache for each partition.
+        """
+        for obj in partitions:
+            if getattr(obj, cache_name) is None:
+                obj._submit_shape()
+        pending = [
+            obj
+            for obj in partitions
+            if isinstance(getattr(obj, cache_name), ray.ObjectID)
+        ]
+        if len(pending):
+            try:
+                values = ray.get([getattr(obj, cache_name) for obj in pending])
+            except RayTaskError as e:
+                handle_ray_task_error(e)
+            for obj, value in zip(pending, values):
+                setattr(obj, cache_name, value)
+        return [getattr(obj, cache_name) for obj in partitions]
+
+    @classmethod
+    def length_of_many(cls, partitions):
+        return cls._get_shape_of_many(partitions, "_length_cache")
+
+    @classmethod
+    def width_of_many(cls, partitions):
+        return cls._get_shape_of_many(partitions, "_width_cache")
+
     @classmethod
     def length_extraction_fn(cls):
         return length_fn_pandas
@@ -87,6 +87,21 @@ class PandasOnRayFrameManager(RayFrameManager):
         new_idx = ray.get(new_idx)
         return new_idx[0].append(new_idx[1:]) if len(new_idx) else new_idx
 
+    @classmethod
+    def to_pandas(cls, partitions):
+        """Convert this object into a Pandas DataFrame from the partitions.
+
+        Returns:
+            A Pandas DataFrame
+        """
+        # Submit the pending calls of every partition before fetching any of them.
+        # Otherwise each partition's queue is only deployed once the previous
+        # partition has been retrieved, which serializes the work.
+        for row in partitions:
+            for obj in row:
+                obj.drain_call_queue()
+        return super(PandasOnRayFrameManager, cls).to_pandas(partitions)
+
     @classmethod
     def groupby_reduce(
         cls, axis, partitions, by, map_func, reduce_func
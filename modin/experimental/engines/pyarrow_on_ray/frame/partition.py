@@ -21,6 +21,8 @@ if __execution_engine__ == "Ray":
 
 
 class PyarrowOnRayFramePartition(PandasOnRayFramePartition):
+    __slots__ = ()
+
     def to_pandas(self):
         """Convert the object stored in this partition to a Pandas DataFrame.
 
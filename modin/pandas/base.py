@@ -38,6 +38,18 @@ from modin.error_message import ErrorMessage
 sentinel = object()
 
 
+def _try_cast_to_pandas(obj):
+    """Convert a Modin DataFrame/Series to its pandas equivalent.
+
+    Note: This is called on every argument of a defaulted operation, so it checks
+        the type directly instead of probing for `_to_pandas` with `hasattr`, which
+        goes through the (slow) `__getattr__` of pandas objects and scalars.
+    """
+    if isinstance(obj, BasePandasDataset):
+        return obj._to_pandas()
+    return obj
+
+
 class BasePandasDataset(object):
     """This object is the base for most of the common code that exists in
         DataFrame/Series. Since both objects share the same underlying representation,
@@ -232,11 +244,10 @@ class BasePandasDataset(object):
                 empty_self_str,
             )
         )
-        args = (a._to_pandas() if hasattr(a, "_to_pandas") else a for a in args)
-        kwargs = {
-            k: v._to_pandas() if hasattr(v, "_to_pandas") else v
-            for k, v in kwargs.items()
-        }
+        if args:
+            args = [_try_cast_to_pandas(a) for a in args]
+        if kwargs:
+            kwargs = {k: _try_cast_to_pandas(v) for k, v in kwargs.items()}
         pandas_obj = self._to_pandas()
         if callable(op):
             result = op(pandas_obj, *args, **kwargs)
@@ -253,9 +264,20 @@ class BasePandasDataset(object):
                 failure_condition=True,
                 extra_log="{} is an unsupported operation".format(op),
             )
+        # Most defaulted operations return an exact pandas DataFrame or Series, so we
+        # check for those first with an identity check before the general cases.
+        result_type = type(result)
+        if result_type is pandas.DataFrame:
+            from .dataframe import DataFrame
+
+            return DataFrame(result)
+        elif result_type is pandas.Series:
+            from .series import Series
+
+            return Series(result)
         # SparseDataFrames cannot be serialized by arrow and cause problems for Modin.
         # For now we will use pandas.
-        if isinstance(result, type(self)) and not isinstance(
+        elif isinstance(result, type(self)) and not isinstance(
             result, (pandas.SparseDataFrame, pandas.SparseSeries)
         ):
             return self._create_or_update_from_compiler(
@@ -106,6 +106,13 @@ def _make_parser_func(sep):
         memory_map=False,
         float_precision=None,
     ):
+        """Read a delimited file into a DataFrame. See `pandas.read_csv`.
+
+        Note: Besides the pandas engines, `engine="pyarrow"` reads a local file with
+            the multithreaded `pyarrow` CSV reader. It is only used when every other
+            argument has its default value and `pyarrow` can parse the file;
+            otherwise the file is silently read with the default parser instead.
+        """
         _, _, _, kwargs = inspect.getargvalues(inspect.currentframe())
         if not kwargs.get("sep", sep):
             kwargs["sep"] = "\t"
@@ -438,7 +445,9 @@ def read_spss(
     from modin.data_management.factories import BaseFactory
 
     return DataFrame(
-        query_compiler=BaseFactory.read_spss(path, usecols, convert_categoricals)
+        query_compiler=BaseFactory.read_spss(
+            path=path, usecols=usecols, convert_categoricals=convert_categoricals
+        )
     )
 
 
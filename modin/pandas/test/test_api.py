@@ -12,6 +12,7 @@
 # governing permissions and limitations under the License.
 
 import modin.pandas as pd
+from modin.pandas.utils import _inherit_docstrings
 import pandas
 import inspect
 import numpy as np
@@ -320,3 +321,68 @@ def test_series_api_equality():
             except IndexError:
                 pass
     assert not len(difference), "Extra params found in API: {}".format(difference)
+
+
+def test_inherit_docstrings():
+    class Parent(object):
+        def method(self):
+            """method docstring"""
+
+        @property
+        def prop(self):
+            """prop docstring"""
+
+        @staticmethod
+        def static():
+            """static docstring"""
+
+        @classmethod
+        def clsmethod(cls):
+            """clsmethod docstring"""
+
+    @_inherit_docstrings(Parent)
+    class Child(object):
+        def method(self):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @staticmethod
+        def static():
+            pass
+
+        @classmethod
+        def clsmethod(cls):
+            pass
+
+    for attr in ["method", "prop", "static", "clsmethod"]:
+        assert getattr(Child, attr).__doc__ == getattr(Parent, attr).__doc__
+    assert pd.DataFrame.from_dict.__doc__ == pandas.DataFrame.from_dict.__doc__
+
+
+def test_inherit_docstrings_excluded():
+    class Parent(object):
+        """Parent docstring"""
+
+        def method(self):
+            """method docstring"""
+
+        def other(self):
+            """other docstring"""
+
+    @_inherit_docstrings(Parent, excluded=[Parent, Parent.method])
+    class Child(object):
+        """Child docstring"""
+
+        def method(self):
+            """Child method docstring"""
+
+        def other(self):
+            pass
+
+    # Excluded objects are matched by identity and keep the child's own docstrings
+    assert Child.__doc__ == "Child docstring"
+    assert Child.method.__doc__ == "Child method docstring"
+    assert Child.other.__doc__ == Parent.other.__doc__
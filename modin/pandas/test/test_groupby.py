@@ -21,115 +21,128 @@ from .utils import df_equals
 pd.DEFAULT_NPARTITIONS = 4
 
 
+# A generator per test keeps its data independent of which other tests ran first.
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
 def ray_df_almost_equals_pandas(ray_df, pandas_df):
-    difference = to_pandas(ray_df) - pandas_df
+    ray_df = to_pandas(ray_df)
+    difference = ray_df - pandas_df
     diff_max = difference.max().max()
     assert (
-        to_pandas(ray_df).equals(pandas_df)
+        ray_df.equals(pandas_df)
         or diff_max < 0.0001
         or (all(ray_df.isna().all()) and all(pandas_df.isna().all()))
     )
 
 
 def ray_groupby_equals_pandas(ray_groupby, pandas_groupby):
-    for g1, g2 in zip(ray_groupby, pandas_groupby):
-        assert g1[0] == g2[0]
-        df_equals(g1[1], g2[1])
+    ray_groups = list(ray_groupby)
+    pandas_groups = list(pandas_groupby)
+    assert [k for k, _ in ray_groups] == [k for k, _ in pandas_groups]
+    # Comparing the shapes keeps the group boundaries checked, so the data itself can
+    # be converted to pandas in one go instead of once per group.
+    assert [g.shape for _, g in ray_groups] == [g.shape for _, g in pandas_groups]
+    if len(ray_groups):
+        axis = pandas_groupby.axis
+        df_equals(
+            pd.concat([g for _, g in ray_groups], axis=axis),
+            pandas.concat([g for _, g in pandas_groups], axis=axis),
+        )
 
 
+@pytest.mark.parametrize(
+    "by", ["col1", lambda x: x % 2, "col0_series"], ids=["label", "func", "series"]
+)
 @pytest.mark.parametrize("as_index", [True, False])
-def test_mixed_dtypes_groupby(as_index):
-    frame_data = np.random.randint(97, 198, size=(2 ** 6, 2 ** 4))
+def test_mixed_dtypes_groupby(by, as_index, rng):
+    frame_data = rng.integers(97, 198, size=(2 ** 6, 2 ** 4))
     pandas_df = pandas.DataFrame(frame_data).add_prefix("col")
     # Convert every other column to string
-    for col in pandas_df.iloc[
-        :, [i for i in range(len(pandas_df.columns)) if i % 2 == 0]
-    ]:
-        pandas_df[col] = [str(chr(i)) for i in pandas_df[col]]
+    for col in pandas_df.iloc[:, ::2]:
+        pandas_df[col] = pandas_df[col].map(chr)
     ray_df = from_pandas(pandas_df)
 
     n = 1
 
-    by_values = [
-        ("col1",),
-        (lambda x: x % 2,),
-        (ray_df["col0"].copy(), pandas_df["col0"].copy()),
-    ]
-
-    for by in by_values:
-        ray_groupby = ray_df.groupby(by=by[0], as_index=as_index)
-        pandas_groupby = pandas_df.groupby(by=by[-1], as_index=as_index)
-
-        ray_groupby_equals_pandas(ray_groupby, pandas_groupby)
-        eval_ngroups(ray_groupby, pandas_groupby)
-        eval_ffill(ray_groupby, pandas_groupby)
-        eval_sem(ray_groupby, pandas_groupby)
-        eval_mean(ray_groupby, pandas_groupby)
-        eval_any(ray_groupby, pandas_groupby)
-        eval_min(ray_groupby, pandas_groupby)
-        eval_idxmax(ray_groupby, pandas_groupby)
-        eval_ndim(ray_groupby, pandas_groupby)
-        eval_cumsum(ray_groupby, pandas_groupby)
-        eval_pct_change(ray_groupby, pandas_groupby)
-        eval_cummax(ray_groupby, pandas_groupby)
-
-        # TODO Add more apply functions
-        apply_functions = [lambda df: df.sum(), min]
-        for func in apply_functions:
-            eval_apply(ray_groupby, pandas_groupby, func)
+    if by == "col0_series":
+        ray_by, pandas_by = ray_df["col0"].copy(), pandas_df["col0"].copy()
+    else:
+        ray_by = pandas_by = by
 
-        eval_dtypes(ray_groupby, pandas_groupby)
-        eval_first(ray_groupby, pandas_groupby)
-        eval_backfill(ray_groupby, pandas_groupby)
-        eval_cummin(ray_groupby, pandas_groupby)
-        eval_bfill(ray_groupby, pandas_groupby)
-        eval_idxmin(ray_groupby, pandas_groupby)
-        eval_prod(ray_groupby, pandas_groupby)
-        if as_index:
-            eval_std(ray_groupby, pandas_groupby)
-            eval_var(ray_groupby, pandas_groupby)
-            eval_skew(ray_groupby, pandas_groupby)
+    ray_groupby = ray_df.groupby(by=ray_by, as_index=as_index)
+    pandas_groupby = pandas_df.groupby(by=pandas_by, as_index=as_index)
 
-        agg_functions = ["min", "max"]
-        for func in agg_functions:
-            eval_agg(ray_groupby, pandas_groupby, func)
-            eval_aggregate(ray_groupby, pandas_groupby, func)
-
-        eval_last(ray_groupby, pandas_groupby)
-        eval_mad(ray_groupby, pandas_groupby)
-        eval_max(ray_groupby, pandas_groupby)
-        eval_len(ray_groupby, pandas_groupby)
-        eval_sum(ray_groupby, pandas_groupby)
-        eval_ngroup(ray_groupby, pandas_groupby)
-        eval_nunique(ray_groupby, pandas_groupby)
-        eval_median(ray_groupby, pandas_groupby)
-        eval_head(ray_groupby, pandas_groupby, n)
-        eval_cumprod(ray_groupby, pandas_groupby)
-        eval_cov(ray_groupby, pandas_groupby)
-
-        transform_functions = [lambda df: df, lambda df: df + df]
-        for func in transform_functions:
-            eval_transform(ray_groupby, pandas_groupby, func)
+    ray_groupby_equals_pandas(ray_groupby, pandas_groupby)
+    eval_ngroups(ray_groupby, pandas_groupby)
+    eval_ffill(ray_groupby, pandas_groupby)
+    eval_sem(ray_groupby, pandas_groupby)
+    eval_mean(ray_groupby, pandas_groupby)
+    eval_any(ray_groupby, pandas_groupby)
+    eval_min(ray_groupby, pandas_groupby)
+    eval_idxmax(ray_groupby, pandas_groupby)
+    eval_ndim(ray_groupby, pandas_groupby)
+    eval_cumsum(ray_groupby, pandas_groupby)
+    eval_pct_change(ray_groupby, pandas_groupby)
+    eval_cummax(ray_groupby, pandas_groupby)
 
-        pipe_functions = [lambda dfgb: dfgb.sum()]
-        for func in pipe_functions:
-            eval_pipe(ray_groupby, pandas_groupby, func)
+    # TODO Add more apply functions
+    apply_functions = [lambda df: df.sum(), min]
+    for func in apply_functions:
+        eval_apply(ray_groupby, pandas_groupby, func)
+
+    eval_dtypes(ray_groupby, pandas_groupby)
+    eval_first(ray_groupby, pandas_groupby)
+    eval_backfill(ray_groupby, pandas_groupby)
+    eval_cummin(ray_groupby, pandas_groupby)
+    eval_bfill(ray_groupby, pandas_groupby)
+    eval_idxmin(ray_groupby, pandas_groupby)
+    eval_prod(ray_groupby, pandas_groupby)
+    if as_index:
+        eval_std(ray_groupby, pandas_groupby)
+        eval_var(ray_groupby, pandas_groupby)
+        eval_skew(ray_groupby, pandas_groupby)
+
+    agg_functions = ["min", "max"]
+    for func in agg_functions:
+        eval_agg(ray_groupby, pandas_groupby, func)
+        eval_aggregate(ray_groupby, pandas_groupby, func)
 
-        eval_corr(ray_groupby, pandas_groupby)
-        eval_fillna(ray_groupby, pandas_groupby)
-        eval_count(ray_groupby, pandas_groupby)
-        eval_tail(ray_groupby, pandas_groupby, n)
-        eval_quantile(ray_groupby, pandas_groupby)
-        eval_take(ray_groupby, pandas_groupby)
-        eval___getattr__(ray_groupby, pandas_groupby, "col2")
-        eval_groups(ray_groupby, pandas_groupby)
+    eval_last(ray_groupby, pandas_groupby)
+    eval_mad(ray_groupby, pandas_groupby)
+    eval_max(ray_groupby, pandas_groupby)
+    eval_len(ray_groupby, pandas_groupby)
+    eval_sum(ray_groupby, pandas_groupby)
+    eval_ngroup(ray_groupby, pandas_groupby)
+    eval_nunique(ray_groupby, pandas_groupby)
+    eval_median(ray_groupby, pandas_groupby)
+    eval_head(ray_groupby, pandas_groupby, n)
+    eval_cumprod(ray_groupby, pandas_groupby)
+    eval_cov(ray_groupby, pandas_groupby)
 
+    transform_functions = [lambda df: df, lambda df: df + df]
+    for func in transform_functions:
+        eval_transform(ray_groupby, pandas_groupby, func)
 
-@pytest.mark.parametrize(
-    "by", [[1, 2, 1, 2], lambda x: x % 3, "col1", ["col1", "col2"]]
-)
-@pytest.mark.parametrize("as_index", [True, False])
-def test_simple_row_groupby(by, as_index):
+    pipe_functions = [lambda dfgb: dfgb.sum()]
+    for func in pipe_functions:
+        eval_pipe(ray_groupby, pandas_groupby, func)
+
+    eval_corr(ray_groupby, pandas_groupby)
+    eval_fillna(ray_groupby, pandas_groupby)
+    eval_count(ray_groupby, pandas_groupby)
+    eval_tail(ray_groupby, pandas_groupby, n)
+    eval_quantile(ray_groupby, pandas_groupby)
+    eval_take(ray_groupby, pandas_groupby)
+    eval___getattr__(ray_groupby, pandas_groupby, "col2")
+    eval_groups(ray_groupby, pandas_groupby)
+
+
+# Groupby doesn't modify the frames, so they are only built once for the module.
+@pytest.fixture(scope="module")
+def simple_row_dfs():
     pandas_df = pandas.DataFrame(
         {
             "col1": [0, 1, 2, 3],
@@ -139,8 +152,15 @@ def test_simple_row_groupby(by, as_index):
             "col5": [-4, -5, -6, -7],
         }
     )
+    return from_pandas(pandas_df), pandas_df
 
-    ray_df = from_pandas(pandas_df)
+
+@pytest.mark.parametrize(
+    "by", [[1, 2, 1, 2], lambda x: x % 3, "col1", ["col1", "col2"]]
+)
+@pytest.mark.parametrize("as_index", [True, False])
+def test_simple_row_groupby(by, as_index, simple_row_dfs):
+    ray_df, pandas_df = simple_row_dfs
     n = 1
     ray_groupby = ray_df.groupby(by=by, as_index=as_index)
     pandas_groupby = pandas_df.groupby(by=by, as_index=as_index)
@@ -297,14 +317,14 @@ def test_single_group_row_groupby():
     eval_groups(ray_groupby, pandas_groupby)
 
 
-def test_large_row_groupby():
+def test_large_row_groupby(rng):
     pandas_df = pandas.DataFrame(
-        np.random.randint(0, 8, size=(100, 4)), columns=list("ABCD")
+        rng.integers(0, 8, size=(100, 4)), columns=list("ABCD")
     )
 
     ray_df = from_pandas(pandas_df)
 
-    by = [str(i) for i in pandas_df["A"].tolist()]
+    by = pandas_df["A"].astype(str).to_numpy()
     n = 4
 
     ray_groupby = ray_df.groupby(by=by)
@@ -450,11 +470,12 @@ def test_simple_col_groupby():
 
 
 @pytest.mark.parametrize(
-    "by", [np.random.randint(0, 100, size=2 ** 8), lambda x: x % 3, None]
+    "by",
+    [np.random.default_rng(1).integers(0, 100, size=2 ** 8), lambda x: x % 3, None],
 )
 @pytest.mark.parametrize("as_index", [True, False])
-def test_series_groupby(by, as_index):
-    series_data = np.random.randint(97, 198, size=2 ** 8)
+def test_series_groupby(by, as_index, rng):
+    series_data = rng.integers(97, 198, size=2 ** 8)
     modin_series = pd.Series(series_data)
     pandas_series = pandas.Series(series_data)
     n = 1
@@ -528,14 +549,14 @@ def test_series_groupby(by, as_index):
         eval_groups(modin_groupby, pandas_groupby)
 
 
-def test_multi_column_groupby():
+def test_multi_column_groupby(rng):
     pandas_df = pandas.DataFrame(
         {
-            "col1": np.random.randint(0, 100, size=1000),
-            "col2": np.random.randint(0, 100, size=1000),
-            "col3": np.random.randint(0, 100, size=1000),
-            "col4": np.random.randint(0, 100, size=1000),
-            "col5": np.random.randint(0, 100, size=1000),
+            "col1": rng.integers(0, 100, size=1000),
+            "col2": rng.integers(0, 100, size=1000),
+            "col3": rng.integers(0, 100, size=1000),
+            "col4": rng.integers(0, 100, size=1000),
+            "col5": rng.integers(0, 100, size=1000),
         },
         index=["row{}".format(i) for i in range(1000)],
     )
@@ -778,22 +799,24 @@ def eval___getattr__(modin_groupby, pandas_groupby, item):
 
 
 def eval_groups(ray_groupby, pandas_groupby):
-    for k, v in ray_groupby.groups.items():
-        assert v.equals(pandas_groupby.groups[k])
+    ray_groups, pandas_groups = ray_groupby.groups, pandas_groupby.groups
+    assert set(ray_groups) == set(pandas_groups)
+    for k, v in ray_groups.items():
+        assert np.array_equal(v.to_numpy(), pandas_groups[k].to_numpy())
 
 
 def eval_shift(ray_groupby, pandas_groupby):
     assert ray_groupby.groups == pandas_groupby.groups
 
 
-def test_groupby_on_index_values_with_loop():
+def test_groupby_on_index_values_with_loop(rng):
     length = 2 ** 6
     data = {
-        "a": np.random.randint(0, 100, size=length),
-        "b": np.random.randint(0, 100, size=length),
-        "c": np.random.randint(0, 100, size=length),
+        "a": rng.integers(0, 100, size=length),
+        "b": rng.integers(0, 100, size=length),
+        "c": rng.integers(0, 100, size=length),
     }
-    idx = ["g1" if i % 3 != 0 else "g2" for i in range(length)]
+    idx = np.where(np.arange(length) % 3 != 0, "g1", "g2")
     modin_df = pd.DataFrame(data, index=idx, columns=list("aba"))
     pandas_df = pandas.DataFrame(data, index=idx, columns=list("aba"))
     modin_groupby_obj = modin_df.groupby(modin_df.index)
@@ -815,13 +838,14 @@ def test_groupby_on_index_values_with_loop():
         df_equals(modin_dict[k], pandas_dict[k])
 
 
-def test_groupby_multiindex():
-    frame_data = np.random.randint(0, 100, size=(2 ** 6, 2 ** 4))
+def test_groupby_multiindex(rng):
+    frame_data = rng.integers(0, 100, size=(2 ** 6, 2 ** 4))
     modin_df = pd.DataFrame(frame_data)
     pandas_df = pandas.DataFrame(frame_data)
 
-    new_columns = pandas.MultiIndex.from_tuples(
-        [(i // 4, i // 2, i) for i in modin_df.columns], names=["four", "two", "one"]
+    cols = np.asarray(modin_df.columns)
+    new_columns = pandas.MultiIndex.from_arrays(
+        [cols // 4, cols // 2, cols], names=["four", "two", "one"]
     )
     modin_df.columns = new_columns
     pandas_df.columns = new_columns
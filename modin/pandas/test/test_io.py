@@ -16,11 +16,13 @@ import numpy as np
 import pandas
 from collections import OrderedDict
 from modin.pandas.utils import to_pandas
+from modin.data_management.factories import BaseFactory
 from pathlib import Path
 import pyarrow as pa
 import pyarrow.parquet as pq
 import os
 import shutil
+import time
 import sqlalchemy as sa
 
 from .utils import df_equals
@@ -842,6 +844,98 @@ def test_from_csv_with_usecols(usecols):
     df_equals(modin_df, pandas_df)
 
 
+def test_from_csv_parquet_cache(monkeypatch):
+    monkeypatch.setenv("MODIN_CSV_PARQUET_CACHE", "True")
+    cache_path = "{}.parquet".format(TEST_CSV_FILENAME)
+    teardown_test_file(cache_path)
+
+    # Record the reads that are served from the Parquet copy
+    parquet_paths = []
+    read_parquet = BaseFactory.__dict__["_read_parquet"].__func__
+
+    def spy_read_parquet(cls, **kwargs):
+        parquet_paths.append(kwargs["path"])
+        return read_parquet(cls, **kwargs)
+
+    monkeypatch.setattr(BaseFactory, "_read_parquet", classmethod(spy_read_parquet))
+
+    # Include missing strings, which Parquet and the CSV parser represent differently
+    with open(TEST_CSV_FILENAME, "w") as f:
+        f.write("a,b\nx,1\n,2\nz,3\n")
+    try:
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME)
+        modin_df = pd.read_csv(TEST_CSV_FILENAME)
+        df_equals(modin_df, pandas_df)
+        assert parquet_paths == []
+
+        # The Parquet copy is written in the background
+        for _ in range(100):
+            if os.path.exists(cache_path):
+                break
+            time.sleep(0.1)
+        assert os.path.exists(cache_path)
+        modin_df = pd.read_csv(TEST_CSV_FILENAME)
+        df_equals(modin_df, pandas_df)
+        assert parquet_paths == [cache_path]
+        # `df_equals` treats None and NaN alike, so check the value itself
+        value = to_pandas(modin_df)["a"][1]
+        assert isinstance(value, float) and np.isnan(value)
+    finally:
+        teardown_test_file(cache_path)
+        teardown_test_file(TEST_CSV_FILENAME)
+
+
+@pytest.fixture
+def pyarrow_read_results(monkeypatch):
+    """Records whether each `engine="pyarrow"` read was done by `pyarrow`."""
+    results = []
+    read_csv_with_pyarrow = BaseFactory.__dict__["_read_csv_with_pyarrow"].__func__
+
+    def spy_read_csv_with_pyarrow(cls, *args, **kwargs):
+        result = read_csv_with_pyarrow(cls, *args, **kwargs)
+        results.append(result is not None)
+        return result
+
+    monkeypatch.setattr(
+        BaseFactory, "_read_csv_with_pyarrow", classmethod(spy_read_csv_with_pyarrow)
+    )
+    return results
+
+
+def test_from_csv_pyarrow_engine(pyarrow_read_results):
+    fname = "modin/pandas/test/data/test_usecols.csv"
+    pandas_df = pandas.read_csv(fname)
+    modin_df = pd.read_csv(fname, engine="pyarrow")
+    df_equals(modin_df, pandas_df)
+    assert pyarrow_read_results == [True]
+
+    # Empty fields and NA markers in string columns are read as NaN, like pandas does
+    with open(TEST_CSV_FILENAME, "w") as f:
+        f.write("a,b\nx,1\n,2\nNA,3\n")
+    try:
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME)
+        modin_df = pd.read_csv(TEST_CSV_FILENAME, engine="pyarrow")
+        df_equals(modin_df, pandas_df)
+        assert pyarrow_read_results == [True, True]
+        # `df_equals` treats None, "" and NaN alike, so check the values themselves
+        for value in to_pandas(modin_df)["a"][1:]:
+            assert isinstance(value, float) and np.isnan(value)
+    finally:
+        teardown_test_file(TEST_CSV_FILENAME)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"usecols": ["a", "e"]}, {"nrows": 2}, {"index_col": 0}]
+)
+def test_from_csv_pyarrow_engine_fallback(pyarrow_read_results, kwargs):
+    # Arguments that `pyarrow` doesn't support fall back to the default parser
+    fname = "modin/pandas/test/data/test_usecols.csv"
+    pandas_df = pandas.read_csv(fname, **kwargs)
+    modin_df = pd.read_csv(fname, engine="pyarrow", **kwargs)
+    df_equals(modin_df, pandas_df)
+    assert pyarrow_read_results == [False]
+
+
 @pytest.mark.skipif(
     __execution_engine__.lower() == "python", reason="Using pandas implementation"
 )
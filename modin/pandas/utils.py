@@ -11,6 +11,8 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import types
+
 
 def from_non_pandas(df, index, columns, dtype):
     from modin.data_management.factories import BaseFactory
@@ -49,7 +51,7 @@ def to_pandas(modin_obj):
     return modin_obj._to_pandas()
 
 
-def _inherit_docstrings(parent, excluded=[]):
+def _inherit_docstrings(parent, excluded=()):
     """Creates a decorator which overwrites a decorated class' __doc__
     attribute with parent's __doc__ attribute. Also overwrites __doc__ of
     methods and properties defined in the class with the __doc__ of matching
@@ -57,24 +59,51 @@ def _inherit_docstrings(parent, excluded=[]):
 
     Args:
         parent (object): Class from which the decorated class inherits __doc__.
-        excluded (list): List of parent objects from which the class does not
-            inherit docstrings.
+        excluded (iterable): Parent objects from which the class does not inherit
+            docstrings. They are matched by identity (`is`), not equality, against
+            the parent itself and the objects found in the parent's class
+            dictionaries, so methods must be given as the plain functions: a bound
+            method or classmethod (e.g. `parent.some_classmethod`) does not match.
 
     Returns:
         function: decorator which replaces the decorated class' documentation
             parent's documentation.
     """
+    # The closure keeps the excluded objects alive, so their ids can't be handed to
+    # other objects before or while the decorator runs.
+    excluded = tuple(excluded)
 
     def decorator(cls):
-        if parent not in excluded:
+        # Excluded objects are matched by identity, so their `__eq__` is never invoked.
+        excluded_ids = frozenset(id(obj) for obj in excluded)
+        if id(parent) not in excluded_ids:
             cls.__doc__ = parent.__doc__
+        # Resolve the parent's attributes with a single walk over its MRO, rather than
+        # a `getattr` (and the MRO walk it implies) per attribute of `cls`.
+        parent_attrs = {}
+        for klass in reversed(parent.__mro__):
+            parent_attrs.update(vars(klass))
         for attr, obj in cls.__dict__.items():
-            parent_obj = getattr(parent, attr, None)
-            if parent_obj in excluded or (
-                not callable(parent_obj) and not isinstance(parent_obj, property)
+            parent_obj = parent_attrs.get(attr)
+            if isinstance(parent_obj, (staticmethod, classmethod)):
+                parent_obj = parent_obj.__func__
+            elif parent_obj is not None and not isinstance(
+                parent_obj, (types.FunctionType, property)
+            ):
+                # Other descriptors may resolve to a different object when accessed
+                # through the class, so look those up the usual way.
+                parent_obj = getattr(parent, attr, None)
+            if (
+                parent_obj is None
+                or id(parent_obj) in excluded_ids
+                or not (callable(parent_obj) or isinstance(parent_obj, property))
             ):
                 continue
-            if callable(obj):
+            if isinstance(obj, (staticmethod, classmethod)):
+                # The descriptor itself is not callable before Python 3.10, so document
+                # the function it wraps.
+                obj.__func__.__doc__ = parent_obj.__doc__
+            elif callable(obj):
                 obj.__doc__ = parent_obj.__doc__
             elif isinstance(obj, property) and obj.fget is not None:
                 p = property(obj.fget, obj.fset, obj.fdel, parent_obj.__doc__)